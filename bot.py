@@ -1,21 +1,35 @@
 import cloudscraper
+import concurrent.futures
+import functools
 import time
 import configparser
 import logging
+import logging.handlers
+import math
 import os
 import random
+import statistics
+import orjson
 import requests
-from typing import Tuple, Dict, Any
+import threading
+import types
+from requests.adapters import HTTPAdapter
+from collections import deque
+from dataclasses import dataclass
+from typing import Tuple, Dict, Any, Optional
 from urllib.parse import urlparse
 from datetime import datetime, timedelta
 import pytz
 
 # Configure logging to save to file and console
+file_handler = logging.handlers.RotatingFileHandler('app.log', maxBytes=10_000_000, backupCount=3, delay=True)  # Simpan log ke file
+file_handler.setFormatter(logging.Formatter('%(asctime)s - %(threadName)s - %(levelname)s - %(message)s'))
+log_buffer = logging.handlers.MemoryHandler(capacity=100, target=file_handler)  # Tulis ke file per 100 record
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
+    format='%(asctime)s - %(threadName)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler('app.log'),  # Simpan log ke file
+        log_buffer,
         logging.StreamHandler()          # Tampilkan di console
     ]
 )
@@ -28,31 +42,124 @@ RED = '\033[91m'
 YELLOW = '\033[93m'
 RESET = '\033[0m'
 
-# Load configuration
-config = configparser.ConfigParser()
-config.read('config.ini')
-
-AUTH_FILE = config.get('settings', 'auth_file', fallback='auth.txt')
-PROXIES_FILE = config.get('settings', 'proxies_file', fallback='proxies.txt')
-SLEEP_BETWEEN_ACCOUNTS = config.getint('settings', 'sleep_between_accounts', fallback=10)
-MAX_RETRIES = config.getint('settings', 'max_retries', fallback=3)
+# Format string log berwarna, dirangkai sekali saat import
+LOG_INVALID_PROXY = "Skipping invalid proxy: " + YELLOW + "%s" + RESET
+LOG_UNSUPPORTED_PROXY = "Skipping proxy with unsupported scheme (http/https only): " + YELLOW + "%s" + RESET
+LOG_PROXY_UNHEALTHY = "Proxy " + YELLOW + "%s" + RESET + " marked unhealthy for %d minutes."
+LOG_PROXY_LATENCY = "Proxy " + YELLOW + "%s" + RESET + " median latency: %.0f ms"
+LOG_PROXY_FALLBACK = "Proxy " + YELLOW + "%s" + RESET + " is unhealthy, using " + YELLOW + "%s" + RESET + " instead."
+LOG_PROXY_IP_INFO = "IP Info for proxy " + YELLOW + "%s" + RESET + ": %s"
+LOG_USING_PROXY = "Using proxy: " + YELLOW + "%s" + RESET
+LOG_CLAIMABLE_REWARDS = "Claimable Rewards - Points: " + GREEN + "%s" + RESET + ", Tickets: " + GREEN + "%s" + RESET
+LOG_USERNAME = "Username: " + CYAN + "%s" + RESET
+LOG_FIRST_NAME = "First Name: " + CYAN + "%s" + RESET
+LOG_POINTS = "Points: " + GREEN + "%s" + RESET
+LOG_TICKETS = "Tickets: " + GREEN + "%s" + RESET
+LOG_NO_TICKETS = "Tickets: " + RED + "%s" + RESET
+LOG_REFERRAL_CLAIMED = GREEN + "Referral claim successful!" + RESET + " You received " + GREEN + "%s" + RESET + " points and " + GREEN + "%s" + RESET + " tickets."
+LOG_GAME_EARNED = "Earned " + GREEN + "%s" + RESET + " points, Total Points: " + GREEN + "%s" + RESET + ", Remaining Tickets: " + YELLOW + "%s" + RESET
+LOG_PROCESSING = "Processing initData with proxy: " + YELLOW + "%s" + RESET
+LOG_TOKEN = "Token received: " + YELLOW + "...%s" + RESET
+LOG_COOKIES = "Cookies received: " + YELLOW + "%s" + RESET
+LOG_TOTAL_POINTS = "Total Points after playing games: " + GREEN + "%s" + RESET
+LOG_STREAK_CLAIMABLE = GREEN + "Streak available to claim." + RESET
+LOG_STREAK_NOT_CLAIMABLE = YELLOW + "Streak not available to claim." + RESET
+LOG_STREAK_CLAIMED = GREEN + "Daily ticket and point claim successful!" + RESET
+LOG_STREAK_CLAIM_FAILED = RED + "Error: Failed to claim daily reward." + RESET
+LOG_REFERRAL_AVAILABLE = GREEN + "Referral claim available! Executing claim..." + RESET
+LOG_REFERRAL_CLAIM_FAILED = RED + "Error executing referral claim." + RESET
+LOG_NO_REFERRAL = YELLOW + "No referral claims available at this time." + RESET
+LOG_REFERRAL_REQUEST_ERROR = RED + "Request error." + RESET
+LOG_GAME_STARTING = YELLOW + "Starting game..." + RESET
+LOG_GAME_FAILED = RED + "Error playing game." + RESET
+
+# Header dasar untuk semua request ke API Midas
+_BASE_HEADERS = types.MappingProxyType({
+    "Accept": "application/json, text/plain, */*",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Content-Type": "application/json",
+    "User-Agent": "Mozilla/5.0 (Linux; Android 10; K) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/133.0.0.0 Mobile Safari/537.36"
+})
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Bot settings read once from config.ini."""
+    auth_file: str = 'auth.txt'
+    proxies_file: str = 'proxies.txt'
+    sleep_between_accounts: int = 10
+    max_retries: int = 3
+    max_workers: int = 16
+    game_countdown_seconds: int = 0
+    game_concurrency: int = 1
+
+def load_settings(filename: str = 'config.ini') -> Settings:
+    """Load configuration from an ini file, falling back to defaults for missing keys."""
+    config = configparser.ConfigParser()
+    config.read(filename)
+    defaults = Settings()
+    return Settings(
+        auth_file=config.get('settings', 'auth_file', fallback=defaults.auth_file),
+        proxies_file=config.get('settings', 'proxies_file', fallback=defaults.proxies_file),
+        sleep_between_accounts=config.getint('settings', 'sleep_between_accounts', fallback=defaults.sleep_between_accounts),
+        max_retries=max(0, config.getint('settings', 'max_retries', fallback=defaults.max_retries)),
+        max_workers=max(1, config.getint('settings', 'max_workers', fallback=defaults.max_workers)),
+        game_countdown_seconds=config.getint('settings', 'game_countdown_seconds', fallback=defaults.game_countdown_seconds),
+        game_concurrency=config.getint('settings', 'game_concurrency', fallback=defaults.game_concurrency),
+    )
 
 # Zona waktu WIB (UTC+7)
 WIB = pytz.timezone('Asia/Jakarta')
 
-# Global variable untuk menyimpan daftar proxy dan IP info
+# Global variable untuk menyimpan daftar proxy dan hasil diagnosa IP proxy yang gagal
 PROXY_LIST = []
-PROXY_IP_INFO = {}
-
-def load_proxies(filename: str) -> list:
-    """Load proxies from file."""
+PROXY_PARSED: Dict[str, dict] = {}
+PROXY_DIAGNOSTICS = {}
+PROXY_DIAGNOSTICS_LOCK = threading.Lock()
+# SOCKS butuh requests[socks] yang tidak ada di requirements.txt
+SUPPORTED_PROXY_SCHEMES = ('http', 'https')
+
+# Cookie Cloudflare (cf_clearance, __cf_bm) per proxy agar challenge tidak diselesaikan ulang tiap akun
+CF_COOKIE_JARS: Dict[str, requests.cookies.RequestsCookieJar] = {}
+CF_COOKIE_LOCK = threading.Lock()
+
+# Cache isi file (mtime, baris) agar reload tiap cycle gratis jika file tidak berubah
+FILE_CACHE: Dict[str, Tuple[int, list]] = {}
+
+# Statistik latensi dan circuit breaker per proxy
+PROXY_STATS: Dict[str, dict] = {}
+PROXY_COOLDOWN_SECONDS = 5 * 60
+PROXY_FAILURE_RATIO = 0.5
+PROXY_MIN_OUTCOMES = 3
+LATENCY_PROBE_URL = "https://api-tg-app.midas.app/favicon.ico"
+
+def read_lines(filename: str) -> list[str]:
+    """Reads non-empty stripped lines from a file, reusing the last result while its mtime is unchanged."""
+    mtime = os.stat(filename).st_mtime_ns
+    cached = FILE_CACHE.get(filename)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    with open(filename, 'r') as file:
+        lines = list(filter(None, map(str.strip, file.read().splitlines())))
+    FILE_CACHE[filename] = (mtime, lines)
+    return lines
+
+def load_proxies(filename: str) -> list[tuple[str, dict]]:
+    """Load proxies from file as (raw_string, parsed_dict) pairs, skipping invalid entries."""
     try:
-        with open(filename, 'r') as file:
-            proxies = [line.strip() for line in file if line.strip()]
-            logger.info(f"Loaded {len(proxies)} proxies from {filename}")
-            return proxies
+        proxies = []
+        for raw in read_lines(filename):
+            if urlparse(raw).scheme not in SUPPORTED_PROXY_SCHEMES:
+                logger.warning(LOG_UNSUPPORTED_PROXY, raw)
+                continue
+            parsed = parse_proxy(raw)
+            if parsed:
+                proxies.append((raw, parsed))
+            else:
+                logger.warning(LOG_INVALID_PROXY, raw)
+        logger.info("Loaded %d proxies from %s", len(proxies), filename)
+        return proxies
     except FileNotFoundError:
-        logger.error(f"Proxy file {filename} not found.")
+        logger.error("Proxy file %s not found.", filename)
         return []
 
 def get_random_proxy() -> str:
@@ -79,130 +186,254 @@ def parse_proxy(proxy_string):
         else:
             host = host_port
             port = '80' if protocol == 'http' else '443'
-        proxy_dict = {}
         if username and password:
             proxy_url = f"{protocol}://{username}:{password}@{host}:{port}"
         else:
             proxy_url = f"{protocol}://{host}:{port}"
-        proxy_dict[protocol] = proxy_url
-        return proxy_dict
+        # Proxy dipakai untuk http dan https (API Midas memakai https)
+        return {"http": proxy_url, "https": proxy_url}
     except Exception as e:
-        logger.error(f"Invalid proxy format. Error: {str(e)}")
+        logger.error("Invalid proxy format. Error: %s", e)
         return None
 
+def _parse_response(response) -> Any:
+    """Parses a response body as JSON with orjson, falling back to the decoded text."""
+    body = response.content
+    try:
+        return orjson.loads(body)
+    except orjson.JSONDecodeError:
+        return body.decode('utf-8', 'replace')
+
 def get_ip_info(proxy: str) -> dict:
     """Get IP information using httpbin.org to verify the IP."""
     try:
         url = "https://httpbin.org/ip"
         response = requests.get(url, proxies={"http": proxy, "https": proxy}, timeout=10)
         response.raise_for_status()
-        return response.json()
+        data = _parse_response(response)
+        return data if isinstance(data, dict) else {}
     except Exception as e:
-        logger.error(f"Failed to fetch IP info for proxy {proxy}. Error: {e}")
+        logger.error("Failed to fetch IP info for proxy %s. Error: %s", proxy, e)
         return {}
 
+def proxy_stats(proxy_string: str) -> dict:
+    """Returns the rolling latency and success/failure windows and circuit-breaker state of a proxy."""
+    return PROXY_STATS.setdefault(proxy_string, {'latencies': deque(maxlen=20), 'outcomes': deque(maxlen=20), 'unhealthy_until': 0.0})
+
+def record_proxy_result(proxy_string: str, latency: Optional[float]):
+    """Records a request latency for a proxy (None for a failure), opening its circuit breaker when too many recent requests failed."""
+    if not proxy_string:
+        return
+    stats = proxy_stats(proxy_string)
+    outcomes = stats['outcomes']
+    outcomes.append(latency is not None)
+    if latency is not None:
+        stats['latencies'].append(latency)
+        return
+    if len(outcomes) >= PROXY_MIN_OUTCOMES and outcomes.count(False) / len(outcomes) >= PROXY_FAILURE_RATIO:
+        # Jendela dikosongkan agar setelah cooldown proxy dinilai dari request baru
+        outcomes.clear()
+        stats['unhealthy_until'] = time.monotonic() + PROXY_COOLDOWN_SECONDS
+        logger.warning(LOG_PROXY_UNHEALTHY, proxy_string, PROXY_COOLDOWN_SECONDS // 60)
+
+def proxy_latency(proxy_string: str) -> float:
+    """Median of the recorded latencies of a proxy, infinite if none were recorded."""
+    latencies = proxy_stats(proxy_string)['latencies']
+    return statistics.median(latencies) if latencies else float('inf')
+
+def is_proxy_healthy(proxy_string: str) -> bool:
+    """Checks whether the circuit breaker of a proxy is closed."""
+    return proxy_stats(proxy_string)['unhealthy_until'] <= time.monotonic()
+
+def measure_proxy_latency(proxy: str, samples: int = 3):
+    """Times HEAD requests to the Midas API through a proxy and records the results."""
+    for _ in range(samples):
+        start = time.monotonic()
+        try:
+            requests.head(LATENCY_PROBE_URL, proxies={"http": proxy, "https": proxy}, timeout=10)
+        except requests.exceptions.RequestException:
+            record_proxy_result(proxy, None)
+            continue
+        record_proxy_result(proxy, time.monotonic() - start)
+
+def measure_proxies(proxies: list[str]):
+    """Probes all proxies in parallel so select_proxy can pick the fastest healthy fallback."""
+    logger.info("Measuring latency for all proxies...")
+    with concurrent.futures.ThreadPoolExecutor(max_workers=32) as executor:
+        list(executor.map(measure_proxy_latency, proxies))
+    for proxy in sorted(proxies, key=proxy_latency):
+        logger.info(LOG_PROXY_LATENCY, proxy, proxy_latency(proxy) * 1000)
+
+def select_proxy(account_index: int) -> str:
+    """Picks the account's own proxy (file order) while healthy, otherwise spreads accounts over the healthy proxies by latency."""
+    preferred = PROXY_LIST[account_index % len(PROXY_LIST)]
+    if is_proxy_healthy(preferred):
+        return preferred
+    healthy = sorted((proxy for proxy in PROXY_LIST if is_proxy_healthy(proxy)), key=proxy_latency)
+    if not healthy:
+        return preferred
+    # Jangan tumpuk semua akun ke satu proxy tercepat agar profil rate limit tetap terpisah
+    fallback = healthy[account_index % len(healthy)]
+    logger.warning(LOG_PROXY_FALLBACK, preferred, fallback)
+    return fallback
+
+def diagnose_proxy(scraper):
+    """Logs IP info in the background for the scraper's proxy the first time it hits a connection error."""
+    proxy_string = scraper.proxy_string
+    if not proxy_string:
+        return
+    with PROXY_DIAGNOSTICS_LOCK:
+        if proxy_string in PROXY_DIAGNOSTICS:
+            return
+        PROXY_DIAGNOSTICS[proxy_string] = {}
+    # Jalankan di thread terpisah agar tidak menambah waktu tunggu retry
+    threading.Thread(target=_diagnose_proxy, args=(proxy_string,), daemon=True).start()
+
+def _diagnose_proxy(proxy_string: str):
+    """Fetches and logs IP info for a proxy."""
+    PROXY_DIAGNOSTICS[proxy_string] = get_ip_info(PROXY_PARSED[proxy_string]['https'])
+    logger.info(LOG_PROXY_IP_INFO, proxy_string, PROXY_DIAGNOSTICS[proxy_string])
+
+def remember_cf_cookies(proxy_string, response, *args, **kwargs):
+    """Response hook that caches Cloudflare cookies per proxy and drops them when Cloudflare blocks us."""
+    with CF_COOKIE_LOCK:
+        if response.status_code in (403, 503):
+            CF_COOKIE_JARS.pop(proxy_string, None)
+        elif response.ok:
+            for cookie in response.cookies:
+                if cookie.name.startswith(('cf_', '__cf')):
+                    CF_COOKIE_JARS.setdefault(proxy_string, requests.cookies.RequestsCookieJar()).set_cookie(cookie)
+    return response
+
 def create_scraper_with_proxy(proxy_string=None):
-    """Creates a cloudscraper instance with proxy support."""
+    """Creates a pooled cloudscraper session with proxy support, reused for all requests of an account."""
     try:
         scraper = cloudscraper.create_scraper()
+        scraper.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=20, max_retries=0))
+        # Tetap pakai adapter TLS cloudscraper (cipher suite mirip browser) agar lolos Cloudflare
+        scraper.mount('https://', cloudscraper.CipherSuiteAdapter(
+            cipherSuite=scraper.cipherSuite,
+            ecdhCurve=scraper.ecdhCurve,
+            server_hostname=scraper.server_hostname,
+            source_address=scraper.source_address,
+            ssl_context=scraper.ssl_context,
+            pool_connections=4,
+            pool_maxsize=20,
+            max_retries=0
+        ))
         if proxy_string:
-            parsed_proxy = parse_proxy(proxy_string)
-            if parsed_proxy:
-                scraper.proxies = parsed_proxy
-                logger.info(f"Using proxy: {YELLOW}{proxy_string}{RESET}")
+            scraper.proxies = PROXY_PARSED[proxy_string]
+            logger.info(LOG_USING_PROXY, proxy_string)
+        with CF_COOKIE_LOCK:
+            if proxy_string in CF_COOKIE_JARS:
+                scraper.cookies.update(CF_COOKIE_JARS[proxy_string])
+        scraper.hooks['response'].append(functools.partial(remember_cf_cookies, proxy_string))
+        scraper.proxy_string = proxy_string
         return scraper
     except Exception as e:
-        logger.error(f"Error creating scraper with proxy: {str(e)}")
+        logger.error("Error creating scraper with proxy: %s", e)
         return None
 
-def post_request(url: str, headers: Dict[str, str], payload: Any = None, retries: int = 0, proxy: str = None) -> Tuple[Any, Any]:
-    """Makes a POST request using cloudscraper with proxy support."""
-    try:
-        scraper = create_scraper_with_proxy(proxy)
-        if not scraper:
-            raise Exception("Failed to create scraper")
-        response = scraper.post(url, json=payload, headers=headers)
-        response.raise_for_status()
+def clone_scraper(scraper):
+    """Creates a separate scraper on the same proxy, seeded with the cookies of an existing one."""
+    # cloudscraper menyimpan state penyelesaian challenge per instance, jadi jangan dipakai bersama antar thread
+    clone = create_scraper_with_proxy(scraper.proxy_string)
+    if clone:
+        clone.cookies.update(scraper.cookies)
+    return clone
+
+def _request(scraper, method: str, url: str, headers: Dict[str, str], max_retries: int, **kwargs):
+    """Sends a request with exponential backoff and jitter, returning the response or None."""
+    error = None
+    for attempt in range(max(0, max_retries) + 1):
         try:
-            return response.json(), response.cookies
-        except ValueError:
-            return response.text, response.cookies
-    except Exception as e:
-        if retries < MAX_RETRIES:
-            logger.warning(f"Request failed: {e}. Retrying in 5 seconds... (Attempt {retries + 1}/{MAX_RETRIES})")
-            time.sleep(5)
-            return post_request(url, headers, payload, retries + 1, proxy)
-        else:
-            logger.error(f"Request failed after multiple retries: {e}")
-            return None, None
+            response = scraper.request(method, url, headers=headers, **kwargs)
+            record_proxy_result(scraper.proxy_string, response.elapsed.total_seconds())
+            response.raise_for_status()
+            return response
+        except requests.exceptions.HTTPError as e:
+            status = e.response.status_code
+            # 4xx selain timeout/rate limit tidak akan berhasil walau diulang
+            if 400 <= status < 500 and status not in (408, 429):
+                logger.error("Request failed with unrecoverable status %d: %s", status, e)
+                return None
+            error = e
+        except requests.exceptions.ConnectionError as e:
+            record_proxy_result(scraper.proxy_string, None)
+            diagnose_proxy(scraper)
+            error = e
+        except Exception as e:
+            error = e
+        if attempt < max_retries:
+            delay = min(30.0, 1.0 * (2 ** attempt)) * (1 + random.uniform(0, 0.5))
+            logger.warning("Request failed: %s. Retrying in %.1f seconds... (Attempt %d/%d)", error, delay, attempt + 1, max_retries)
+            time.sleep(delay)
+    logger.error("Request failed after multiple retries: %s", error)
+    return None
 
-def get_request(url: str, headers: Dict[str, str], retries: int = 0, proxy: str = None) -> Any:
-    """Makes a GET request using cloudscraper with proxy support."""
+def post_request(scraper, url: str, headers: Dict[str, str], max_retries: int, payload: Any = None) -> Tuple[Any, Any]:
+    """Makes a POST request using the account's cloudscraper session."""
+    response = _request(scraper, 'POST', url, headers, max_retries, json=payload)
+    if response is None:
+        return None, None
+    return _parse_response(response), response.cookies
+
+def get_request(scraper, url: str, headers: Dict[str, str], max_retries: int) -> Any:
+    """Makes a GET request using the account's cloudscraper session."""
+    response = _request(scraper, 'GET', url, headers, max_retries)
+    if response is None:
+        return None
     try:
-        scraper = create_scraper_with_proxy(proxy)
-        if not scraper:
-            raise Exception("Failed to create scraper")
-        response = scraper.get(url, headers=headers)
-        response.raise_for_status()
-        try:
-            return response.json()
-        except ValueError:
-            logger.warning("Response is not JSON.")
-            return None
-    except Exception as e:
-        if retries < MAX_RETRIES:
-            logger.warning(f"Request failed: {e}. Retrying in 5 seconds... (Attempt {retries + 1}/{MAX_RETRIES})")
-            time.sleep(5)
-            return get_request(url, headers, retries + 1, proxy)
-        else:
-            logger.error(f"Request failed after multiple retries: {e}")
-            return None
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError:
+        logger.warning("Response is not JSON.")
+        return None
 
 def read_init_data(filename: str) -> list[str]:
     """Reads init data from a file."""
     try:
-        with open(filename, 'r') as file:
-            init_data_list = [line.strip() for line in file if line.strip()]
-            return init_data_list
+        return read_lines(filename)
     except FileNotFoundError:
-        logger.error(f"File {filename} not found.")
+        logger.error("File %s not found.", filename)
         return []
 
-def get_streak_info(headers: Dict[str, str], proxy: str):
+def get_streak_info(scraper, headers: Dict[str, str], settings: Settings):
     """Gets and prints streak information."""
     url_streak = "https://api-tg-app.midas.app/api/streak"
-    streak_data = get_request(url_streak, headers, proxy=proxy)
+    streak_data = get_request(scraper, url_streak, headers, settings.max_retries)
     if streak_data:
         streak_days_count = streak_data.get("streakDaysCount", "Not found")
         next_rewards = streak_data.get("nextRewards", {})
         points = next_rewards.get("points", "Not found")
         tickets = next_rewards.get("tickets", "Not found")
         claimable = streak_data.get("claimable", False)
-        logger.info(f"Streak Days Count: {streak_days_count}")
-        logger.info(f"Claimable Rewards - Points: {GREEN}{points}{RESET}, Tickets: {GREEN}{tickets}{RESET}")
+        logger.info("Streak Days Count: %s", streak_days_count)
+        logger.info(LOG_CLAIMABLE_REWARDS, points, tickets)
         if claimable:
-            logger.info(f"{GREEN}Streak available to claim.{RESET}")
-            claim_streak(headers, proxy)
+            logger.info(LOG_STREAK_CLAIMABLE)
+            claim_streak(scraper, headers, settings)
         else:
-            logger.warning(f"{YELLOW}Streak not available to claim.{RESET}")
+            logger.warning(LOG_STREAK_NOT_CLAIMABLE)
     else:
         logger.error("Error: Could not access streak API.")
 
-def claim_streak(headers: Dict[str, str], proxy: str):
+def claim_streak(scraper, headers: Dict[str, str], settings: Settings) -> bool:
     """Claims the daily streak reward."""
     url_claim = "https://api-tg-app.midas.app/api/streak"
-    response, _ = post_request(url_claim, headers, proxy=proxy)
+    response, _ = post_request(scraper, url_claim, headers, settings.max_retries)
     if response:
         points = response.get("points", "Not found")
         tickets = response.get("tickets", "Not found")
-        logger.info(f"{GREEN}Daily ticket and point claim successful!{RESET}")
+        logger.info(LOG_STREAK_CLAIMED)
+        return True
     else:
-        logger.error(f"{RED}Error: Failed to claim daily reward.{RESET}")
+        logger.error(LOG_STREAK_CLAIM_FAILED)
+        return False
 
-def get_user_info(headers: Dict[str, str], proxy: str) -> Tuple[int, int]:
+def get_user_info(scraper, headers: Dict[str, str], settings: Settings) -> Tuple[int, int]:
     """Gets and prints user information."""
     url_user = "https://api-tg-app.midas.app/api/user"
-    user_data = get_request(url_user, headers, proxy=proxy)
+    user_data = get_request(scraper, url_user, headers, settings.max_retries)
     if user_data:
         telegram_id = user_data.get("telegramId", "Not found")
         username = user_data.get("username", "Not found")
@@ -211,112 +442,163 @@ def get_user_info(headers: Dict[str, str], proxy: str) -> Tuple[int, int]:
         tickets = user_data.get("tickets", 0)
         games_played = user_data.get("gamesPlayed", "Not found")
         streak_days_count = user_data.get("streakDaysCount", "Not found")
-        logger.info(f"Telegram ID: {telegram_id}")
-        logger.info(f"Username: {CYAN}{username}{RESET}")
-        logger.info(f"First Name: {CYAN}{first_name}{RESET}")
-        logger.info(f"Points: {GREEN}{points}{RESET}")
-        logger.info(f"Tickets: {GREEN if tickets > 0 else RED}{tickets}{RESET}")
-        logger.info(f"Games Played: {games_played}")
-        logger.info(f"Streak Days Count: {streak_days_count}")
+        logger.info("Telegram ID: %s", telegram_id)
+        logger.info(LOG_USERNAME, username)
+        logger.info(LOG_FIRST_NAME, first_name)
+        logger.info(LOG_POINTS, points)
+        logger.info(LOG_TICKETS if tickets > 0 else LOG_NO_TICKETS, tickets)
+        logger.info("Games Played: %s", games_played)
+        logger.info("Streak Days Count: %s", streak_days_count)
         return tickets, points
     else:
         logger.error("Error: Could not access user API.")
         return 0, 0
 
-def check_referral_status(headers: Dict[str, str], proxy: str) -> Tuple[int, int]:
+def check_referral_status(scraper, headers: Dict[str, str], settings: Settings) -> Tuple[int, int]:
     """Checks and claims referral rewards if available."""
     url_referral = "https://api-tg-app.midas.app/api/referral/status"
     url_referral_claim = "https://api-tg-app.midas.app/api/referral/claim"
-    referral_data = get_request(url_referral, headers, proxy=proxy)
+    referral_data = get_request(scraper, url_referral, headers, settings.max_retries)
     if referral_data:
         can_claim = referral_data.get("canClaim", False)
         if can_claim:
-            logger.info(f"{GREEN}Referral claim available! Executing claim...{RESET}")
-            claim_response, _ = post_request(url_referral_claim, headers, proxy=proxy)
+            logger.info(LOG_REFERRAL_AVAILABLE)
+            claim_response, _ = post_request(scraper, url_referral_claim, headers, settings.max_retries)
             if claim_response:
                 total_points = claim_response.get("totalPoints", 0)
                 total_tickets = claim_response.get("totalTickets", 0)
-                logger.info(f"{GREEN}Referral claim successful!{RESET} You received {GREEN}{total_points}{RESET} points and {GREEN}{total_tickets}{RESET} tickets.")
+                logger.info(LOG_REFERRAL_CLAIMED, total_points, total_tickets)
                 return total_points, total_tickets
             else:
-                logger.error(f"{RED}Error executing referral claim.{RESET}")
+                logger.error(LOG_REFERRAL_CLAIM_FAILED)
                 return 0, 0
         else:
-            logger.warning(f"{YELLOW}No referral claims available at this time.{RESET}")
+            logger.warning(LOG_NO_REFERRAL)
             return 0, 0
     else:
-        logger.error(f"{RED}Request error.{RESET}")
+        logger.error(LOG_REFERRAL_REQUEST_ERROR)
         return 0, 0
 
-def play_game(headers: Dict[str, str], tickets: int, proxy: str) -> int:
-    """Plays the game using available tickets."""
+def play_game(scraper, headers: Dict[str, str], tickets: int, settings: Settings) -> int:
+    """Plays the game using available tickets, sending up to game_concurrency plays at once."""
     url_game = "https://api-tg-app.midas.app/api/game/play"
+    concurrency = max(1, settings.game_concurrency)
     total_points = 0
-    while tickets > 0:
-        for i in range(3, 0, -1):
-            print(f"Starting game in {YELLOW}{i}{RESET} seconds...", end='\r')
-            time.sleep(1)
-        logger.info(f"{YELLOW}Starting game...{RESET}")
-        game_data, _ = post_request(url_game, headers, proxy=proxy)
-        if game_data:
-            points_earned = game_data.get("points", 0)
-            total_points += points_earned
-            tickets -= 1
-            logger.info(f"Earned {GREEN}{points_earned}{RESET} points, Total Points: {GREEN}{total_points}{RESET}, Remaining Tickets: {YELLOW}{tickets}{RESET}")
-        else:
-            logger.error(f"{RED}Error playing game.{RESET}")
-            break
+
+    # Tiap thread game memakai scraper sendiri jika dijalankan paralel
+    local = threading.local()
+    worker_scrapers = []
+
+    def play_once(_ticket):
+        worker_scraper = scraper
+        if concurrency > 1:
+            worker_scraper = getattr(local, 'scraper', None)
+            if worker_scraper is None:
+                worker_scraper = local.scraper = clone_scraper(scraper)
+                if worker_scraper is None:
+                    return None
+                worker_scrapers.append(worker_scraper)
+        logger.info(LOG_GAME_STARTING)
+        game_data, _ = post_request(worker_scraper, url_game, headers, settings.max_retries)
+        return game_data
+
+    # Dengan concurrency 1 main langsung di thread akun, tanpa executor
+    executor = None
+    if concurrency > 1:
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix=threading.current_thread().name)
+    try:
+        while tickets > 0:
+            if settings.game_countdown_seconds > 0:
+                for i in range(settings.game_countdown_seconds, 0, -1):
+                    print(f"Starting game in {YELLOW}{i}{RESET} seconds...", end='\r')
+                    time.sleep(1)
+            else:
+                # Jeda singkat acak agar request game antar akun tidak serentak
+                time.sleep(random.uniform(0.3, 0.8))
+            if executor:
+                results = executor.map(play_once, range(min(concurrency, tickets)))
+            else:
+                results = [play_once(0)]
+            failed = False
+            for game_data in results:
+                if game_data:
+                    points_earned = game_data.get("points", 0)
+                    total_points += points_earned
+                    tickets -= 1
+                    logger.info(LOG_GAME_EARNED, points_earned, total_points, tickets)
+                else:
+                    logger.error(LOG_GAME_FAILED)
+                    failed = True
+            if failed:
+                break
+    finally:
+        if executor:
+            executor.shutdown()
+        for worker_scraper in worker_scrapers:
+            worker_scraper.close()
     return total_points
 
-def process_init_data(init_data: str, proxy_index: int):
+def process_init_data(init_data: str, account_index: int, settings: Settings):
     """Processes the initData and performs game actions using proxy from the list."""
-    if proxy_index < len(PROXY_LIST):
-        current_proxy = PROXY_LIST[proxy_index]
-        logger.info(f"Processing initData with proxy: {YELLOW}{current_proxy}{RESET}")
-    else:
+    if not PROXY_LIST:
         logger.error("No more proxies available for this cycle.")
         return
+    current_proxy = select_proxy(account_index)
 
-    url_register = "https://api-tg-app.midas.app/api/auth/register"
-    headers_register = {
-        "Accept": "application/json, text/plain, */*",
-        "Accept-Language": "en-US,en;q=0.9",
-        "Content-Type": "application/json",
-        "User-Agent": "Mozilla/5.0 (Linux; Android 10; K) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/133.0.0.0 Mobile Safari/537.36"
-    }
-    payload = {"initData": init_data}
-    response_text, cookies = post_request(url_register, headers_register, payload, proxy=current_proxy)
-
-    if response_text:
-        logger.info(f"Token received: {YELLOW}...{response_text[-20:]}{RESET}")
-        cookies_dict = cookies.get_dict() if cookies else {}
-        cookies_preview = {key: f"...{value[-20:]}" for key, value in cookies_dict.items()}
-        logger.info(f"Cookies received: {YELLOW}{cookies_preview}{RESET}")
-        token = response_text.strip()
-        if not token:
-            logger.error("Error: Token is empty or invalid.")
-            return
-        headers_user = {
-            "Accept": "application/json, text/plain, */*",
-            "Accept-Language": "en-US,en;q=0.9",
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json",
-            "User-Agent": "Mozilla/5.0 (Linux; Android 10; K) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/133.0.0.0 Mobile Safari/537.36",
-            "Cookie": "; ".join([f"{key}={value}" for key, value in cookies_dict.items()])
-        }
-        try:
-            get_streak_info(headers_user, current_proxy)
-            check_referral_status(headers_user, current_proxy)
-            tickets, points = get_user_info(headers_user, current_proxy)
-            if tickets > 0:
-                total_points = play_game(headers_user, tickets, current_proxy)
-                logger.info(f"Total Points after playing games: {GREEN}{total_points}{RESET}")
-            else:
-                logger.warning("No tickets available to play games.")
-        except Exception as e:
-            logger.error(f"Error during subsequent actions: {e}")
-    else:
-        logger.error("Error: Could not get token. Registration failed.")
+    # Jitter awal agar akun paralel tidak menembak API bersamaan
+    time.sleep(random.uniform(0, settings.sleep_between_accounts))
+    logger.info(LOG_PROCESSING, current_proxy)
+
+    scraper = create_scraper_with_proxy(current_proxy)
+    if not scraper:
+        logger.error("Error: Failed to create scraper.")
+        return
+
+    try:
+        url_register = "https://api-tg-app.midas.app/api/auth/register"
+        headers_register = dict(_BASE_HEADERS)
+        payload = {"initData": init_data}
+        response_text, cookies = post_request(scraper, url_register, headers_register, settings.max_retries, payload)
+
+        if response_text:
+            logger.info(LOG_TOKEN, response_text[-20:])
+            cookies_dict = cookies.get_dict() if cookies else {}
+            cookies_preview = {key: f"...{value[-20:]}" for key, value in cookies_dict.items()}
+            logger.info(LOG_COOKIES, cookies_preview)
+            token = response_text.strip()
+            if not token:
+                logger.error("Error: Token is empty or invalid.")
+                return
+            # Tanpa header Cookie eksplisit: cookie jar session mengirim cookie Midas dan Cloudflare sekaligus
+            headers_user = {
+                **_BASE_HEADERS,
+                "Authorization": f"Bearer {token}"
+            }
+            try:
+                # Sengaja berurutan: scraper kedua per akun (CONNECT/TLS/challenge baru) lebih mahal dari satu round trip yang dihemat
+                get_streak_info(scraper, headers_user, settings)
+                check_referral_status(scraper, headers_user, settings)
+                tickets, points = get_user_info(scraper, headers_user, settings)
+                if tickets > 0:
+                    total_points = play_game(scraper, headers_user, tickets, settings)
+                    logger.info(LOG_TOTAL_POINTS, total_points)
+                else:
+                    logger.warning("No tickets available to play games.")
+            except Exception as e:
+                logger.error("Error during subsequent actions: %s", e)
+        else:
+            logger.error("Error: Could not get token. Registration failed.")
+    finally:
+        scraper.close()
+
+def process_account(account_index: int, init_data: str, settings: Settings):
+    """Runs process_init_data for one account inside a worker thread, logging any error."""
+    # Nama thread ikut tercetak di log agar baris dari akun paralel bisa dibedakan
+    threading.current_thread().name = f"account-{account_index + 1}"
+    try:
+        process_init_data(init_data, account_index, settings)
+    except Exception as e:
+        logger.error("Error processing init_data for account %d: %s", account_index + 1, e)
 
 def get_next_reset_time():
     """Menghitung waktu berikutnya untuk reset harian pada pukul 08:00 WIB."""
@@ -328,25 +610,31 @@ def get_next_reset_time():
 
 def countdown_to_next_reset(next_reset):
     """Menampilkan countdown hingga waktu reset berikutnya."""
+    # Deadline dalam epoch dihitung sekali; time.time() tetap tepat setelah suspend/penyesuaian jam tanpa lookup zona waktu tiap tick
+    deadline = next_reset.timestamp()
     try:
         while True:
-            now = datetime.now(WIB)
-            time_left = next_reset - now
-            if time_left.total_seconds() <= 0:
+            remaining = deadline - time.time()
+            if remaining <= 0:
                 break
-            hours, remainder = divmod(int(time_left.total_seconds()), 3600)
+            # Dibulatkan ke atas: bangun tepat sebelum batas menit tidak boleh tampil sebagai HH:MM:59
+            total = math.ceil(remaining)
+            hours, remainder = divmod(total, 3600)
             minutes, seconds = divmod(remainder, 60)
             countdown_str = f"Next reset in: {hours:02d}:{minutes:02d}:{seconds:02d}"
             print(f"\r{YELLOW}{countdown_str}{RESET}", end='', flush=True)
-            time.sleep(1)
+            # Update per menit (dibulatkan ke menit penuh), per detik pada menit terakhir
+            time.sleep((remaining % 60 or 60) if remaining > 60 else min(remaining, 1.0))
         print(f"\r{YELLOW}Starting next cycle...{RESET}", end='', flush=True)
     except KeyboardInterrupt:
         logger.info("Countdown interrupted by user (Ctrl+C). Exiting gracefully...")
         print(f"\n{YELLOW}Script terminated by user.{RESET}")
         exit(0)
 
-def main():
+def main(settings: Optional[Settings] = None):
     """Main execution with cycle running at 08:00 WIB daily and countdown."""
+    settings = settings or load_settings()
+
     # Clear terminal di awal
     os.system('cls' if os.name == 'nt' else 'clear')
 
@@ -362,9 +650,11 @@ def main():
     """
     print(watermark)
 
-    global PROXY_LIST, PROXY_IP_INFO
-    PROXY_LIST = load_proxies(PROXIES_FILE)
-    init_data_list = read_init_data(AUTH_FILE)
+    global PROXY_LIST, PROXY_PARSED
+    proxies = load_proxies(settings.proxies_file)
+    PROXY_LIST = [raw for raw, _ in proxies]
+    PROXY_PARSED = dict(proxies)
+    init_data_list = read_init_data(settings.auth_file)
 
     if not init_data_list:
         logger.error("No init data found. Exiting...")
@@ -372,34 +662,39 @@ def main():
     if not PROXY_LIST:
         logger.error("No proxies found. Exiting...")
         return
+    measure_proxies(PROXY_LIST)
 
-    # Cek IP info untuk semua proxy di awal
-    logger.info("Checking IP info for all proxies...")
-    for proxy in PROXY_LIST:
-        PROXY_IP_INFO[proxy] = get_ip_info(proxy)
-        logger.info(f"IP Info for proxy {YELLOW}{proxy}{RESET}: {PROXY_IP_INFO[proxy]}")
-
-    logger.info(f"Starting script with {len(init_data_list)} accounts and {len(PROXY_LIST)} proxies")
+    logger.info("Starting script with %d accounts and %d proxies", len(init_data_list), len(PROXY_LIST))
     logger.info("Cycles will run daily at 08:00 WIB")
 
     cycle_count = 0
     try:
         while True:
             cycle_count += 1
-            logger.info(f"Starting cycle {cycle_count} at {datetime.now(WIB)}")
-
-            proxy_index = 0
-            for init_data in init_data_list:
-                try:
-                    process_init_data(init_data, proxy_index)
-                except Exception as e:
-                    logger.error(f"Error processing init_data with proxy index {proxy_index}: {str(e)}")
-                time.sleep(SLEEP_BETWEEN_ACCOUNTS)
-                proxy_index = (proxy_index + 1) % len(PROXY_LIST)  # Rotasi proxy
+            logger.info("Starting cycle %d at %s", cycle_count, datetime.now(WIB))
+
+            if cycle_count > 1:
+                # Muat ulang akun dan proxy jika file diedit selama countdown
+                init_data_list = read_init_data(settings.auth_file) or init_data_list
+                proxies = load_proxies(settings.proxies_file)
+                if proxies and [raw for raw, _ in proxies] != PROXY_LIST:
+                    PROXY_PARSED = dict(proxies)
+                    PROXY_LIST = [raw for raw, _ in proxies]
+                    measure_proxies(PROXY_LIST)
+
+            executor = concurrent.futures.ThreadPoolExecutor(max_workers=min(len(PROXY_LIST), settings.max_workers))
+            try:
+                list(executor.map(lambda args: process_account(*args, settings), enumerate(init_data_list)))
+            except KeyboardInterrupt:
+                # Batalkan akun yang masih antre agar Ctrl+C langsung berhenti
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+            executor.shutdown()
 
             # Hitung waktu tunggu hingga 08:00 WIB berikutnya dan tampilkan countdown
             next_reset = get_next_reset_time()
-            logger.info(f"Cycle {cycle_count} completed at {datetime.now(WIB)}. Waiting until next reset at {next_reset}")
+            logger.info("Cycle %d completed at %s. Waiting until next reset at %s", cycle_count, datetime.now(WIB), next_reset)
+            log_buffer.flush()
             countdown_to_next_reset(next_reset)
     except KeyboardInterrupt:
         logger.info("Script interrupted by user (Ctrl+C). Exiting gracefully...")